@@ -2,12 +2,8 @@ import logging
 import os
 from pathlib import Path
 
-import sentry_sdk
 from dotenv import load_dotenv
 from loguru import logger
-from sentry_sdk.integrations.fastapi import FastApiIntegration
-from sentry_sdk.integrations.logging import LoggingIntegration
-from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
 
 __version__ = "1.6.6"
 
@@ -35,6 +31,13 @@ APP_VERSION = _detect_build_version()
 # Initialize Sentry as early as possible (only if DSN is provided)
 _dsn = os.getenv("SENTRY_DSN")
 if _dsn:
+    # Imported lazily: the FastAPI integration pulls in fastapi/starlette, which
+    # CLI and worker entrypoints importing `app.*` shouldn't pay for when disabled.
+    import sentry_sdk
+    from sentry_sdk.integrations.fastapi import FastApiIntegration
+    from sentry_sdk.integrations.logging import LoggingIntegration
+    from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
+
     sentry_sdk.init(
         dsn=_dsn,
         integrations=[
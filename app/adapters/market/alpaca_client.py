@@ -15,7 +15,7 @@ from app.utils.http import request_json
 __all__ = ["AlpacaMarketClient", "AlpacaAuthError", "ping_alpaca", "AlpacaPingError"]
 
 
-_ALLOWED_FEEDS = {"iex", "sip"}
+_ALLOWED_FEEDS = frozenset({"iex", "sip"})
 
 
 # --- Alpaca trading API ping helpers ---
@@ -59,7 +59,8 @@ async def health_db() -> Dict[str, Any]:
     t0 = time.perf_counter()
     ok = False
     try:
-        ok = bool(ping(retries=1))
+        # ping() is blocking SQLAlchemy I/O; keep it off the event loop.
+        ok = bool(await run_in_threadpool(ping, retries=1))
     except Exception:
         ok = False
     latency_ms = round((time.perf_counter() - t0) * 1000.0, 1)
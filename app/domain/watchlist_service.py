@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import re
 from typing import List, Optional, Tuple
 
 from loguru import logger
@@ -15,8 +16,12 @@ from .watchlist_sources import (
     fetch_twelvedata_symbols,
 )
 
-_ALLOWED_SOURCES = {"auto", "alpha", "finnhub", "textlist", "manual", "twelvedata"}
+_ALLOWED_SOURCES = frozenset(
+    {"auto", "alpha", "finnhub", "textlist", "manual", "twelvedata"}
+)
 _DEFAULT_SOURCE = "textlist"
+# Symbols in WATCHLIST_TEXT are separated by commas and/or any whitespace.
+_MANUAL_TOKEN = re.compile(r"[^\s,]+")
 
 _COUNTERS: dict[str, dict[str, int]] = {}
 _WARNED_KEYS: set[str] = set()
@@ -101,13 +106,7 @@ def _parse_manual_from_env() -> List[str]:
             "[watchlist] manual source enabled but WATCHLIST_TEXT is empty",
         )
         return []
-    tokens: List[str] = []
-    for chunk in raw.replace("\n", " ").split(","):
-        chunk = chunk.strip()
-        if not chunk:
-            continue
-        tokens.extend(chunk.split())
-    return tokens
+    return _MANUAL_TOKEN.findall(raw)
 
 
 def resolve_watchlist() -> Tuple[str, List[str]]:
@@ -3,9 +3,8 @@ from __future__ import annotations
 import os
 from typing import Iterable, List, Optional
 
-import requests
-
 from app.utils import env as ENV
+from app.utils.http import shared_session
 
 ALPHAVANTAGE_ENDPOINT = "https://www.alphavantage.co/query"
 FINNHUB_ENDPOINT = "https://finnhub.io/api/v1"
@@ -36,7 +35,7 @@ def fetch_alpha_vantage_symbols(
         "apikey": api_key,
     }
     try:
-        resp = requests.get(
+        resp = shared_session().get(
             ALPHAVANTAGE_ENDPOINT, params=params, timeout=ENV.HTTP_TIMEOUT
         )
         if resp.status_code != 200:
@@ -56,7 +55,7 @@ def fetch_finnhub_symbols(
         return []
     params = {"exchange": "US", "token": api_key}
     try:
-        resp = requests.get(
+        resp = shared_session().get(
             f"{FINNHUB_ENDPOINT}/stock/symbol", params=params, timeout=ENV.HTTP_TIMEOUT
         )
         if resp.status_code != 200:
@@ -80,7 +79,7 @@ def fetch_twelvedata_symbols(
         return []
     params = {"source": "docs", "apikey": api_key}
     try:
-        resp = requests.get(
+        resp = shared_session().get(
             f"{TWELVEDATA_ENDPOINT}/stocks", params=params, timeout=ENV.HTTP_TIMEOUT
         )
         if resp.status_code != 200:
@@ -7,6 +7,7 @@ from contextlib import asynccontextmanager
 from uuid import uuid4
 
 from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from loguru import logger
 
 import app as app_package  # noqa: F401  # ensure package __init__ (Sentry) runs
@@ -15,6 +16,13 @@ from app.config import settings
 from app.logging_utils import logging_context, setup_logging
 from app.observability import configure_observability
 
+_DefaultResponse: type[JSONResponse]
+try:  # optional dependency: C-accelerated response serialization
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as _DefaultResponse
+except ImportError:  # pragma: no cover
+    _DefaultResponse = JSONResponse
+
 __all__ = ["app"]
 
 
@@ -45,7 +53,12 @@ async def lifespan(app: FastAPI):
     yield
 
 
-app = FastAPI(title="AI Trader", version=settings.VERSION, lifespan=lifespan)
+app = FastAPI(
+    title="AI Trader",
+    version=settings.VERSION,
+    lifespan=lifespan,
+    default_response_class=_DefaultResponse,
+)
 
 # Mount aggregated API routers
 mount_routes(app)
@@ -9,10 +9,10 @@ from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
-import requests
 
 from app.adapters.market.alpaca_client import AlpacaAuthError
 from app.utils import env as ENV
+from app.utils.http import shared_session
 
 try:  # optional dependency for redundancy
     import yfinance as yf  # type: ignore
@@ -75,7 +75,7 @@ def _alpha_quote(symbols: Sequence[str]) -> Tuple[Dict[str, Snapshot], Optional[
             "apikey": api_key,
         }
         try:
-            resp = requests.get(
+            resp = shared_session().get(
                 ALPHAVANTAGE_URL, params=params, timeout=ENV.HTTP_TIMEOUT
             )
             payload = (
@@ -113,7 +113,7 @@ def _finnhub_quote(symbols: Sequence[str]) -> Tuple[Dict[str, Snapshot], Optiona
     for sym in symbols:
         attempted += 1
         try:
-            resp = requests.get(
+            resp = shared_session().get(
                 f"{FINNHUB_URL}/quote",
                 params={"symbol": sym, "token": api_key},
                 timeout=ENV.HTTP_TIMEOUT,
@@ -162,7 +162,7 @@ def _twelvedata_quote(
     out: Dict[str, Snapshot] = {}
     for sym in symbols:
         try:
-            resp = requests.get(
+            resp = shared_session().get(
                 f"{TWELVEDATA_URL}/quote",
                 params={"symbol": sym, "apikey": api_key},
                 timeout=ENV.HTTP_TIMEOUT,
@@ -238,7 +238,7 @@ def _alpaca_quote(symbols: Sequence[str]) -> Tuple[Dict[str, Snapshot], Optional
     out: Dict[str, Snapshot] = {}
     for sym in symbols:
         try:
-            resp = requests.get(
+            resp = shared_session().get(
                 f"{base_url}/v2/stocks/{sym}/snapshot",
                 headers=headers,
                 timeout=ENV.HTTP_TIMEOUT,
@@ -322,7 +322,9 @@ def _alpha_bars(symbol: str, interval: str) -> Optional[pd.DataFrame]:
         "outputsize": "compact",
     }
     try:
-        resp = requests.get(ALPHAVANTAGE_URL, params=params, timeout=ENV.HTTP_TIMEOUT)
+        resp = shared_session().get(
+            ALPHAVANTAGE_URL, params=params, timeout=ENV.HTTP_TIMEOUT
+        )
         if resp.status_code != 200:
             return None
         key = next((k for k in resp.json().keys() if k.startswith("Time Series")), None)
@@ -348,7 +350,7 @@ def _finnhub_bars(symbol: str, resolution: str, count: int) -> Optional[pd.DataF
     if not api_key:
         return None
     try:
-        resp = requests.get(
+        resp = shared_session().get(
             f"{FINNHUB_URL}/stock/candle",
             params={
                 "symbol": symbol,
@@ -379,7 +381,7 @@ def _twelvedata_bars(
     if not api_key:
         return None
     try:
-        resp = requests.get(
+        resp = shared_session().get(
             f"{TWELVEDATA_URL}/time_series",
             params={
                 "symbol": symbol,
@@ -424,7 +426,7 @@ def _alpaca_bars(symbol: str, timeframe: str, limit: int) -> Optional[pd.DataFra
         return None
     base_url = ENV.ALPACA_DATA_BASE_URL.rstrip("/")
     try:
-        resp = requests.get(
+        resp = shared_session().get(
             f"{base_url}/stocks/{symbol}/bars",
             params={"timeframe": timeframe, "limit": limit},
             headers=headers,
@@ -23,11 +23,13 @@ def extract_symbols(raw: str, max_symbols: int = 100) -> List[str]:
         logger.debug("extract_symbols called with empty input.")
         return []
 
-    raw_clean = raw.replace(",", " ").upper().strip()
-    syms = [m.group(0) for m in _TICKER_RE.finditer(raw_clean)]
-
-    out = [s for s in syms if s not in _BLACKLIST]
-    out = [s for s in out if 1 <= len(s) <= 5 and s.isalpha()]
+    # Commas are non-word chars, so \b already splits on them; the regex caps
+    # plain tickers at 5 letters, and isalpha() drops dotted/dashed classes.
+    out = [
+        s
+        for s in _TICKER_RE.findall(raw.upper())
+        if s.isalpha() and s not in _BLACKLIST
+    ]
 
     unique = list(dict.fromkeys(out))  # preserve order, dedupe
     logger.info("Extracted {} symbols: {}", len(unique), unique[:10])
@@ -7,6 +7,8 @@ from typing import Iterable, List, Set
 
 logger = logging.getLogger(__name__)
 
+_TRUTHY = frozenset({"1", "true", "t", "yes", "y", "on"})
+
 # ------------------------------------------------------------------------------
 # Helpers
 # ------------------------------------------------------------------------------
@@ -23,7 +25,7 @@ def get_bool(name: str, default: bool = False) -> bool:
     raw = os.getenv(name)
     if raw is None:
         return default
-    return str(raw).strip().lower() in {"1", "true", "t", "yes", "y", "on"}
+    return raw.strip().lower() in _TRUTHY
 
 
 def get_int(name: str, default: int) -> int:
@@ -99,10 +101,13 @@ def get_int_set(name: str) -> Set[int]:
 
 
 def _list_lower(name: str, default: str = "") -> List[str]:
-    return [p.lower() for p in get_csv(name, default)]
+    raw = os.getenv(name)
+    if raw is None or raw.strip() == "":
+        raw = default
+    return [p for p in (s.strip() for s in (raw or "").lower().split(",")) if p]
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class EnvSettings:
     """Runtime configuration sourced from environment variables."""
 
@@ -233,6 +238,10 @@ class EnvSettings:
             ("HTTP_BACKOFF", "HTTP_RETRY_BACKOFF_SEC"), 1.5
         )
     )
+    #: Upper bound (seconds) for exponential retry backoff before jitter.
+    HTTP_BACKOFF_CAP: float = field(
+        default_factory=lambda: get_float("HTTP_BACKOFF_CAP", 30.0)
+    )
     #: HTTP user-agent header for outbound requests.
     HTTP_USER_AGENT: str = field(
         default_factory=lambda: get_str(
@@ -269,12 +278,10 @@ class EnvSettings:
     HTTP_TIMEOUT: int = field(init=False)
 
     def __post_init__(self) -> None:
-        object.__setattr__(
-            self, "YF_ENABLED", any(p == "yahoo" for p in self.PRICE_PROVIDERS)
-        )
-        object.__setattr__(self, "HTTP_RETRIES", self.HTTP_RETRY_ATTEMPTS)
-        object.__setattr__(self, "HTTP_BACKOFF", self.HTTP_RETRY_BACKOFF_SEC)
-        object.__setattr__(self, "HTTP_TIMEOUT", self.HTTP_TIMEOUT_SECS)
+        self.YF_ENABLED = "yahoo" in self.PRICE_PROVIDERS
+        self.HTTP_RETRIES = self.HTTP_RETRY_ATTEMPTS
+        self.HTTP_BACKOFF = self.HTTP_RETRY_BACKOFF_SEC
+        self.HTTP_TIMEOUT = self.HTTP_TIMEOUT_SECS
 
 
 ENV = EnvSettings()
@@ -320,6 +327,7 @@ ACA_JOB_NAME = ENV.ACA_JOB_NAME
 HTTP_TIMEOUT_SECS = ENV.HTTP_TIMEOUT_SECS
 HTTP_RETRY_ATTEMPTS = ENV.HTTP_RETRY_ATTEMPTS
 HTTP_RETRY_BACKOFF_SEC = ENV.HTTP_RETRY_BACKOFF_SEC
+HTTP_BACKOFF_CAP = ENV.HTTP_BACKOFF_CAP
 HTTP_USER_AGENT = ENV.HTTP_USER_AGENT
 HTTP_RETRIES = ENV.HTTP_RETRIES
 HTTP_BACKOFF = ENV.HTTP_BACKOFF
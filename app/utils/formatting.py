@@ -1,6 +1,11 @@
 # app/utils/formatting.py
+from __future__ import annotations
+
+
 def fmt_money(x) -> str:
+    if isinstance(x, (int, float)):
+        return f"${x:,.2f}"
     try:
         return f"${float(x):,.2f}"
-    except Exception:
+    except (TypeError, ValueError):
         return "—"
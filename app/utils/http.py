@@ -1,47 +1,79 @@
 from __future__ import annotations
 
-import random
 import time
-from typing import Any, Dict, Optional, Tuple
+from functools import lru_cache
+from random import random as _rand
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
 
 from app.utils import env as ENV
 
+try:  # optional dependency: C-accelerated JSON decoding
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as _json_loads  # type: ignore[assignment]
+
 # ------------------------------------------------------------------------------
 # Header helpers
 # ------------------------------------------------------------------------------
 
 
-def _ensure_ua(headers: Optional[Dict[str, str]]) -> Dict[str, str]:
-    merged = {"User-Agent": ENV.HTTP_USER_AGENT}
-    if headers:
-        merged.update(headers)
-    return merged
+# Shared default headers; read-only so callers without overrides don't pay
+# for a fresh dict on every request.
+_UA_ONLY_HEADERS: Mapping[str, str] = MappingProxyType(
+    {"User-Agent": ENV.HTTP_USER_AGENT}
+)
+_JSON_HEADERS: Mapping[str, str] = MappingProxyType(
+    {"Accept": "application/json", "Content-Type": "application/json"}
+)
 
+# Statuses worth retrying (timeouts, throttling, transient upstream errors).
+_RETRY_CODES = frozenset((408, 429, 500, 502, 503, 504))
 
-def alpaca_headers() -> Dict[str, str]:
-    """Standard Alpaca auth + JSON + UA headers.
-    Returns minimal JSON headers if keys are missing so callers can handle 401s.
-    """
+
+def _ensure_ua(headers: Optional[Mapping[str, str]]) -> Mapping[str, str]:
+    if not headers:
+        return _UA_ONLY_HEADERS
+    return {**_UA_ONLY_HEADERS, **headers}
+
+
+@lru_cache(maxsize=4)
+def _alpaca_headers_for(key: str, secret: str, user_agent: str) -> Mapping[str, str]:
     base = {
         "Accept": "application/json",
         "Content-Type": "application/json",
-        "User-Agent": ENV.HTTP_USER_AGENT,
+        "User-Agent": user_agent,
     }
-    if ENV.ALPACA_API_KEY and ENV.ALPACA_API_SECRET:
-        base["APCA-API-KEY-ID"] = ENV.ALPACA_API_KEY
-        base["APCA-API-SECRET-KEY"] = ENV.ALPACA_API_SECRET
-    return base
+    if key and secret:
+        base["APCA-API-KEY-ID"] = key
+        base["APCA-API-SECRET-KEY"] = secret
+    return MappingProxyType(base)
 
 
-def with_alpaca(headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+def alpaca_headers() -> Mapping[str, str]:
+    """Standard Alpaca auth + JSON + UA headers.
+    Returns minimal JSON headers if keys are missing so callers can handle 401s.
+    The mapping is cached per credential set and read-only; copy it to modify.
+    """
+    return _alpaca_headers_for(
+        ENV.ALPACA_API_KEY, ENV.ALPACA_API_SECRET, ENV.HTTP_USER_AGENT
+    )
+
+
+def with_alpaca(headers: Optional[Mapping[str, str]] = None) -> Mapping[str, str]:
     """Merge caller headers with alpaca auth + UA."""
-    merged = alpaca_headers()
-    if headers:
-        merged.update(headers)
-    return merged
+    if not headers:
+        return alpaca_headers()
+    return {**alpaca_headers(), **headers}
+
+
+def _loads(body: bytes) -> Any:
+    """Decode a raw JSON body (orjson when installed); empty bodies become {}."""
+    return _json_loads(body) if body else {}
 
 
 # ------------------------------------------------------------------------------
@@ -49,6 +81,31 @@ def with_alpaca(headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
 # ------------------------------------------------------------------------------
 
 
+def _build_session() -> requests.Session:
+    """Shared keep-alive session; retries stay in request_json, not the adapter."""
+    sess = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0)
+    sess.mount("https://", adapter)
+    sess.mount("http://", adapter)
+    # Accept-Encoding is left to requests/urllib3: gzip/deflate, plus br when
+    # the `brotli` package is installed (decoded transparently).
+    sess.headers.update({"User-Agent": ENV.HTTP_USER_AGENT})
+    return sess
+
+
+# Default client for callers that don't bring their own session.
+_SESSION = _build_session()
+
+
+def shared_session() -> requests.Session:
+    """The pooled, User-Agent-tagged session behind `request_json`.
+
+    For modules that issue raw `requests` calls (non-JSON bodies, custom error
+    handling) so they share its connection pool instead of building their own.
+    """
+    return _SESSION
+
+
 def compute_backoff_delay(
     attempt: int, backoff: float, retry_after: Optional[str]
 ) -> float:
@@ -64,9 +121,11 @@ def compute_backoff_delay(
                 retry_after,
                 exc,
             )
-    # Jittered backoff: base * (attempt+1) * (0.85..1.15)
-    jitter = random.uniform(0.85, 1.15)  # nosec B311 - jitter is non-crypto randomness
-    return max(0.1, backoff * (attempt + 1) * jitter)
+    # Full jitter: uniform(0, min(cap, base * 2**attempt)) de-synchronizes
+    # concurrent retries against shared rate limits.
+    ceiling = min(ENV.HTTP_BACKOFF_CAP, backoff * (2**attempt))
+    delay = ceiling * _rand()  # nosec B311 - jitter is non-crypto randomness
+    return delay if delay > 0.1 else 0.1
 
 
 def _log_http_event(
@@ -79,19 +138,22 @@ def _log_http_event(
     retries: int,
     start_time: float,
     note: str = "",
+    error: BaseException | None = None,
 ) -> None:
-    latency_ms = round((time.perf_counter() - start_time) * 1000.0, 1)
-    logger.log(
-        level,
-        "[http] method={} url={} status={} latency_ms={:.1f} attempt={}/{} {}",
-        method.upper(),
-        url,
-        status,
-        latency_ms,
-        attempt + 1,
-        retries + 1,
-        note,
-    )
+    # loguru only evaluates lazy arguments when a sink accepts ``level``, so the
+    # latency math and formatting (including str(error)) are skipped when
+    # INFO/WARNING are filtered out.
+    def _render() -> str:
+        latency_ms = round((time.perf_counter() - start_time) * 1000.0, 1)
+        tail = note
+        if error is not None:
+            tail = f"error={str(error) or type(error).__name__}"
+        return (
+            f"[http] method={method} url={url} status={status} "
+            f"latency_ms={latency_ms:.1f} attempt={attempt + 1}/{retries + 1} {tail}"
+        )
+
+    logger.opt(lazy=True).log(level, "{}", _render)
 
 
 def request_json(
@@ -99,7 +161,7 @@ def request_json(
     url: str,
     *,
     params: Optional[Dict[str, Any]] = None,
-    headers: Optional[Dict[str, str]] = None,
+    headers: Optional[Mapping[str, str]] = None,
     json: Optional[Dict[str, Any]] = None,
     data: Any = None,
     timeout: Optional[int] = None,
@@ -109,62 +171,59 @@ def request_json(
 ) -> Tuple[int, Dict[str, Any]]:
     """Make an HTTP request expecting JSON. Returns (status_code, json_dict).
 
-    - Retries on 408/429/5xx and network errors up to `retries` times with jittered backoff.
+    - Retries on 408/429/5xx and network errors up to `retries` times with
+      full-jitter exponential backoff.
     - Respects `Retry-After` header when present.
-    - On non-JSON responses, returns empty dict.
+    - Bodies are decoded from raw bytes as JSON regardless of Content-Type;
+      on non-JSON responses, returns empty dict.
     - On repeated network failure, returns (599, {}).
     """
     timeout = timeout if timeout is not None else ENV.HTTP_TIMEOUT
     retries = retries if retries is not None else ENV.HTTP_RETRIES
     backoff = backoff if backoff is not None else ENV.HTTP_BACKOFF
 
+    method_u = method.upper()
     merged = _ensure_ua(headers)
 
-    client = session or requests
+    client = session or _SESSION
     last_exc: Exception | None = None
+    # Prepared once and re-sent on retries so URL/header/body encoding is not
+    # redone per attempt (mirrors what Session.request does internally).
+    prepared: requests.PreparedRequest | None = None
+    send_kwargs: Dict[str, Any] = {}
 
     for attempt in range(retries + 1):
         start_time = time.perf_counter()
         try:
-            resp = client.request(
-                method=method.upper(),
-                url=url,
-                params=params or {},
-                headers=merged,
-                json=json,
-                data=data,
-                timeout=timeout,
-            )
-
-            # Success path
-            if 200 <= resp.status_code < 300:
-                _log_http_event(
-                    level="INFO",
-                    method=method,
-                    url=url,
-                    status=resp.status_code,
-                    attempt=attempt,
-                    retries=retries,
-                    start_time=start_time,
-                    note="ok",
+            if prepared is None:
+                prepared = client.prepare_request(
+                    requests.Request(
+                        method=method_u,
+                        url=url,
+                        params=params,
+                        headers=merged,
+                        json=json,
+                        data=data,
+                    )
                 )
-                try:
-                    return resp.status_code, resp.json()
-                except Exception:
-                    logger.exception("JSON decode failed for {}", url)
-                    return resp.status_code, {}
+                send_kwargs = client.merge_environment_settings(
+                    prepared.url, {}, None, None, None
+                )
+            resp = client.send(prepared, timeout=timeout, **send_kwargs)
+
+            status = resp.status_code
+            ok = 200 <= status < 300
 
             # Retryable?
-            retryable = resp.status_code in {408, 429, 500, 502, 503, 504}
-            if retryable and attempt < retries:
+            if status in _RETRY_CODES and attempt < retries:
                 sleep_s = compute_backoff_delay(
                     attempt, backoff, resp.headers.get("Retry-After")
                 )
                 _log_http_event(
                     level="WARNING",
-                    method=method,
+                    method=method_u,
                     url=url,
-                    status=resp.status_code,
+                    status=status,
                     attempt=attempt,
                     retries=retries,
                     start_time=start_time,
@@ -172,9 +231,9 @@ def request_json(
                 )
                 logger.warning(
                     "HTTP {} {} -> {} — retry {}/{} in {:.2f}s",
-                    method.upper(),
+                    method_u,
                     url,
-                    resp.status_code,
+                    status,
                     attempt + 1,
                     retries,
                     sleep_s,
@@ -182,42 +241,46 @@ def request_json(
                 time.sleep(sleep_s)
                 continue
 
-            # Non-retriable or exhausted
+            # Success, non-retriable, or exhausted: decode the body exactly once.
             _log_http_event(
-                level="WARNING",
-                method=method,
+                level="INFO" if ok else "WARNING",
+                method=method_u,
                 url=url,
-                status=resp.status_code,
+                status=status,
                 attempt=attempt,
                 retries=retries,
                 start_time=start_time,
-                note="non-2xx",
+                note="ok" if ok else "non-2xx",
             )
             try:
-                return resp.status_code, resp.json()
-            except Exception:
-                # Truncate body for logging
-                body = (resp.text or "")[:400]
-                logger.debug("Non-JSON response for {}: {}", url, body)
-                return resp.status_code, {}
+                return status, _loads(resp.content)
+            except ValueError:
+                if ok:
+                    logger.exception("JSON decode failed for {}", url)
+                else:
+                    # Truncate body for logging
+                    logger.debug(
+                        "Non-JSON response for {}: {}", url, (resp.text or "")[:400]
+                    )
+                return status, {}
 
         except requests.RequestException as e:
             last_exc = e
             _log_http_event(
                 level="WARNING",
-                method=method,
+                method=method_u,
                 url=url,
                 status=599,
                 attempt=attempt,
                 retries=retries,
                 start_time=start_time,
-                note=f"error={e}",
+                error=e,
             )
             if attempt < retries:
                 sleep_s = compute_backoff_delay(attempt, backoff, None)
                 logger.warning(
                     "HTTP {} {} error — retry {}/{} in {:.2f}s: {}",
-                    method.upper(),
+                    method_u,
                     url,
                     attempt + 1,
                     retries,
@@ -229,9 +292,7 @@ def request_json(
             break
 
     if last_exc:
-        logger.error(
-            "HTTP {} {} failed after retries: {}", method.upper(), url, last_exc
-        )
+        logger.error("HTTP {} {} failed after retries: {}", method_u, url, last_exc)
     return 599, {}
 
 
@@ -243,7 +304,7 @@ def request_json(
 def http_get(
     url: str,
     params: Optional[Dict[str, Any]] = None,
-    headers: Optional[Dict[str, str]] = None,
+    headers: Optional[Mapping[str, str]] = None,
     *,
     timeout: Optional[int] = None,
     retries: Optional[int] = None,
@@ -263,16 +324,14 @@ def http_get(
 def http_post_json(
     url: str,
     json_body: Optional[Dict[str, Any]] = None,
-    headers: Optional[Dict[str, str]] = None,
+    headers: Optional[Mapping[str, str]] = None,
     *,
     timeout: Optional[int] = None,
     retries: Optional[int] = None,
     backoff: Optional[float] = None,
 ) -> Tuple[int, Dict[str, Any]]:
     # Ensure JSON content-type by default
-    h = {"Accept": "application/json", "Content-Type": "application/json"}
-    if headers:
-        h.update(headers)
+    h = {**_JSON_HEADERS, **headers} if headers else _JSON_HEADERS
     return request_json(
         "POST",
         url,
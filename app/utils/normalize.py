@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, List
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, List
 
 _SMART_MAP = {
     "\u2018": "'",
@@ -22,32 +23,46 @@ _SMART_MAP = {
     "\u00b4": "'",
 }
 _SMART_DASHES = {"\u2013", "\u2014", "\u2212"}
-_KV_PATTERN = re.compile(r"--([A-Za-z0-9_-]+)=(?:\"([^\"]*)\"|'([^']*)'|([^\s]+))")
+# Single-pass translation table: smart quotes -> ASCII quotes, dashes -> "--".
+_NORMALIZE_TABLE = str.maketrans({**_SMART_MAP, **{d: "--" for d in _SMART_DASHES}})
+_SMART_TRIGGER = frozenset(_SMART_MAP) | _SMART_DASHES
+# shlex-style tokens: runs of quoted segments and non-space chars; a lone
+# (unbalanced) quote is kept as a literal character.
+_ARG_TOKEN = re.compile(r"""(?:"[^"]*"|'[^']*'|\S)+""")
+_ARG_QUOTED = re.compile(r""""([^"]*)"|'([^']*)'""")
+_SYMBOL_TOKEN = re.compile(r"[^\s,]+")
+_KV_PATTERN = re.compile(
+    r"--(?P<key>[A-Za-z0-9_-]+)=(?:\"(?P<dq>[^\"]*)\"|'(?P<sq>[^']*)'|(?P<plain>[^\s]+))"
+)
 
 
 def normalize_quotes_and_dashes(text: str) -> str:
     """Normalize fancy quotes and dashes to plain ASCII variants."""
     if not text:
         return ""
-    out = text
-    for src, dst in _SMART_MAP.items():
-        out = out.replace(src, dst)
-    for dash in _SMART_DASHES:
-        out = out.replace(dash, "--")
-    return out
+    # Backtick is the only mapped ASCII character; everything else is non-ASCII.
+    if text.isascii() and "`" not in text:
+        return text
+    # Non-ASCII text (emoji, accents) without smart punctuation needs no copy.
+    if _SMART_TRIGGER.isdisjoint(text):
+        return text
+    return text.translate(_NORMALIZE_TABLE)
 
 
 def parse_kv_flags(text: str) -> Dict[str, str]:
     """Extract --key=value pairs handling smart quotes/dashes."""
     cleaned = normalize_quotes_and_dashes(text or "")
-    matches = _KV_PATTERN.findall(cleaned)
     result: Dict[str, str] = {}
-    for key, dq, sq, plain in matches:
-        value = dq or sq or plain or ""
-        result[key] = value.strip()
+    for m in _KV_PATTERN.finditer(cleaned):
+        value = m["dq"] or m["sq"] or m["plain"] or ""
+        result[m["key"]] = value.strip()
     return result
 
 
+def _unquote(m: re.Match[str]) -> str:
+    return m[1] if m[1] is not None else m[2]
+
+
 def parse_watchlist_args(text: str) -> Dict[str, Any]:
     """
     Parse CLI watchlist arguments into structured options.
@@ -58,8 +73,6 @@ def parse_watchlist_args(text: str) -> Dict[str, Any]:
     Returns:
         Dict containing symbols, limit, session_hint, title, include_filters.
     """
-    import shlex
-
     opts: Dict[str, Any] = {
         "symbols": [],
         "limit": None,
@@ -71,31 +84,29 @@ def parse_watchlist_args(text: str) -> Dict[str, Any]:
     if not raw:
         return opts
 
-    try:
-        parts = shlex.split(raw)
-    except ValueError:
-        parts = raw.split()
-
-    for part in parts:
-        if part.startswith("--limit="):
+    symbols: List[str] = opts["symbols"]
+    for part in _ARG_TOKEN.findall(raw):
+        if "'" in part or '"' in part:
+            part = _ARG_QUOTED.sub(_unquote, part)
+        if not part.startswith("--"):
+            # Comma-delimited entries are split in the same pass.
+            symbols.extend(s.upper() for s in _SYMBOL_TOKEN.findall(part))
+            continue
+        if part in ("--filters", "--no-filters"):
+            opts["include_filters"] = part == "--filters"
+            continue
+        key, sep, value = part.partition("=")
+        if not sep:
+            continue
+        if key == "--limit":
             try:
-                opts["limit"] = int(part.split("=", 1)[1])
+                opts["limit"] = int(value)
             except ValueError:
                 continue
-        elif part.startswith("--session="):
-            opts["session_hint"] = part.split("=", 1)[1]
-        elif part.startswith("--title="):
-            opts["title"] = part.split("=", 1)[1].strip('"').strip("'")
-        elif part in ("--filters", "--no-filters"):
-            opts["include_filters"] = part == "--filters"
-        elif not part.startswith("--"):
-            opts["symbols"].append(part.replace(",", " ").strip().upper())
-
-    # Split comma-delimited entries that may have slipped through
-    expanded: List[str] = []
-    for sym in opts["symbols"]:
-        expanded.extend([s for s in sym.split() if s])
-    opts["symbols"] = expanded
+        elif key == "--session":
+            opts["session_hint"] = value
+        elif key == "--title":
+            opts["title"] = value.strip("\"'")
     return opts
 
 
@@ -105,19 +116,28 @@ def bars_to_map(bars_obj: Any, symbols: List[str]) -> Dict[str, List[Dict[str, A
       - list of bar dicts (with 'S' or 'T' for symbol), or
       - dict {SYM: [bar,...]}
     """
-    out: Dict[str, List[Dict[str, Any]]] = {s: [] for s in symbols}
+    out: DefaultDict[str, List[Dict[str, Any]]] = defaultdict(
+        list, {s: [] for s in symbols}
+    )
     if isinstance(bars_obj, list):
+        # Resolve each raw symbol's bucket (and its .upper()) once, not per bar.
+        buckets: Dict[str, List[Dict[str, Any]]] = {}
         for b in bars_obj:
             if not isinstance(b, dict):
                 continue
-            sym = (b.get("S") or b.get("T") or "").upper()
-            if sym:
-                out.setdefault(sym, []).append(b)
+            raw = b.get("S") or b.get("T")
+            if not raw:
+                continue
+            bucket = buckets.get(raw)
+            if bucket is None:
+                bucket = buckets[raw] = out[raw.upper()]
+            bucket.append(b)
     elif isinstance(bars_obj, dict):
         for k, v in bars_obj.items():
             sym = (k or "").upper()
             if not sym:
                 continue
-            seq = v if isinstance(v, list) else []
-            out.setdefault(sym, []).extend([x for x in seq if isinstance(x, dict)])
-    return out
+            bucket = out[sym]
+            if isinstance(v, list):
+                bucket.extend(x for x in v if isinstance(x, dict))
+    return dict(out)
@@ -91,10 +91,13 @@ class ChronosRuntime:
             return [0.0 for _ in range(horizon)]
         if arr.size == 1:
             return [float(arr[0]) for _ in range(horizon)]
-        x = np.arange(arr.size)
-        slope = float(np.polyfit(x, arr, 1)[0])
+        # Closed-form OLS slope on centered x (sum(x_c) == 0, so no y-mean term
+        # is needed and sum(x_c**2) == n(n^2 - 1)/12); avoids polyfit's lstsq.
+        n = arr.size
+        x_centered = np.arange(n) - (n - 1) / 2.0
+        slope = float(arr @ x_centered) / (n * (n * n - 1) / 12.0)
         start = float(arr[-1])
-        return [start + slope * (i + 1) for i in range(horizon)]
+        return (start + slope * np.arange(1, horizon + 1)).tolist()
 
     def forecast(self, series: List[float], horizon: int) -> Dict[str, Any]:
         if not self.ready:
@@ -103,7 +106,7 @@ class ChronosRuntime:
             raise ValueError("horizon must be > 0")
         forecast = self._trend_forecast(series, horizon)
         return {
-            "forecast": [float(x) for x in forecast],
+            "forecast": forecast,
             "adapter_tag": self.effective_adapter,
             "hf_sha": self.hf_commit,
         }
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import pytest
+
+from app.dal.vendors.base import FetchRequest
+from app.dal.vendors.market_data import alpaca as module
+from app.dal.vendors.market_data.alpaca import AlpacaVendor
+from app.utils import http
+
+
+def test_fetch_bars_reads_rotated_credentials(monkeypatch: pytest.MonkeyPatch) -> None:
+    seen_keys = []
+
+    def fake_http_get(url, params, headers):
+        seen_keys.append(headers.get("APCA-API-KEY-ID"))
+        return 200, {
+            "bars": {
+                "AAPL": [
+                    {
+                        "t": "2024-01-02T14:30:00Z",
+                        "o": 1.0,
+                        "h": 2.0,
+                        "l": 0.5,
+                        "c": 1.5,
+                        "v": 100,
+                    }
+                ]
+            }
+        }
+
+    monkeypatch.setattr(module, "http_get", fake_http_get)
+    monkeypatch.setattr(http.ENV, "ALPACA_API_SECRET", "secret")
+    monkeypatch.setattr(http.ENV, "ALPACA_API_KEY", "key-1")
+    vendor = AlpacaVendor(feed="iex")
+    request = FetchRequest(symbol="aapl", start=None, end=None, interval="1Day")
+
+    bars = vendor.fetch_bars(request)
+    monkeypatch.setattr(http.ENV, "ALPACA_API_KEY", "key-2")
+    vendor.fetch_bars(request)
+
+    assert seen_keys == ["key-1", "key-2"]
+    assert [bar.close for bar in bars.data] == [1.5]
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import importlib.util
+import io
+import re
+from pathlib import Path
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+
+from app.db import Base
+
+_VERSIONS = Path(__file__).resolve().parents[2] / "migrations" / "versions"
+
+
+def _load_revision(filename: str):
+    spec = importlib.util.spec_from_file_location(filename[:-3], _VERSIONS / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _render_offline(module) -> str:
+    buf = io.StringIO()
+    ctx = MigrationContext.configure(
+        dialect_name="postgresql",
+        opts={"as_sql": True, "output_buffer": buf},
+    )
+    with Operations.context(ctx):
+        module.upgrade()
+    return buf.getvalue()
+
+
+def _metadata_pk_name(table_key: str) -> str:
+    ddl = str(
+        CreateTable(Base.metadata.tables[table_key]).compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    match = re.search(r"CONSTRAINT (\w+) PRIMARY KEY", ddl)
+    assert match, ddl
+    return match.group(1)
+
+
+def test_hypertable_migration_uses_metadata_pk_names():
+    sql = _render_offline(_load_revision("f253bbd8a80a_timescale_hypertables.py"))
+
+    dropped = dict(re.findall(r"ALTER TABLE (\S+) DROP CONSTRAINT (\w+);", sql))
+    added = re.findall(
+        r"ALTER TABLE (\S+) ADD CONSTRAINT (\w+) PRIMARY KEY \(id, (\w+)\);", sql
+    )
+
+    assert set(dropped) == {
+        "market.price_snapshots",
+        "trading.fills",
+        "backtest.strategy_run_equity",
+    }
+    for table, name in dropped.items():
+        assert name == _metadata_pk_name(table)
+    assert {table: name for table, name, _ in added} == dropped
+    assert sql.count("PERFORM create_hypertable(") == 4
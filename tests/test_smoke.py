@@ -31,3 +31,25 @@ def test_router_run_offline_smoke(client):
     data = resp.json()
     assert data["run_id"]
     assert data["order_intent"]["symbol"] == "AAPL"
+
+
+def test_health_db_runs_ping_off_event_loop(client, monkeypatch):
+    import asyncio
+
+    import app.api.routes.health as health_module
+
+    seen = {}
+
+    def fake_ping(**kwargs):
+        try:
+            asyncio.get_running_loop()
+            seen["on_loop"] = True
+        except RuntimeError:
+            seen["on_loop"] = False
+        return True
+
+    monkeypatch.setattr(health_module, "ping", fake_ping)
+    resp = client.get("/health/db")
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "ok"
+    assert seen["on_loop"] is False
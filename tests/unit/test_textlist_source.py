@@ -47,3 +47,9 @@ def test_textlist_get_symbols_no_backends(monkeypatch):
     monkeypatch.delenv("TEXTLIST_BACKENDS", raising=False)
     symbols = textlist_source.get_symbols()
     assert symbols == []
+
+
+def test_extract_symbols_filters_in_one_pass():
+    raw = "aapl,TSLA  nvda\nBRK.B the AAPL TOOLONG, msft"
+    assert textlist_source.extract_symbols(raw) == ["AAPL", "TSLA", "NVDA", "MSFT"]
+    assert textlist_source.extract_symbols(raw, max_symbols=2) == ["AAPL", "TSLA"]
@@ -73,3 +73,12 @@ def test_env_legacy_http_settings(monkeypatch):
     assert env_module.HTTP_TIMEOUT == 25
     assert env_module.HTTP_RETRIES == 4
     assert env_module.HTTP_BACKOFF == 3.5
+
+
+def test_env_price_providers_lowercased_and_trimmed(monkeypatch):
+    monkeypatch.setenv("PRICE_PROVIDERS", " Alpaca , ,YAHOO ")
+
+    env_module = reload_env()
+
+    assert env_module.PRICE_PROVIDERS == ["alpaca", "yahoo"]
+    assert env_module.YF_ENABLED is True
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from app.utils.formatting import fmt_money
+
+
+def test_fmt_money_numeric_and_fallback():
+    assert fmt_money(1234.5) == "$1,234.50"
+    assert fmt_money(7) == "$7.00"
+    assert fmt_money("12.3") == "$12.30"
+    assert fmt_money(None) == "—"
+    assert fmt_money("n/a") == "—"
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import json
 from typing import Any, Dict, List
 
+import requests
 from loguru import logger
 
 from app.utils import http
@@ -18,18 +20,20 @@ class DummyResponse:
         self._payload = payload
         self.headers = headers or {}
         self.text = ""
+        self.content = json.dumps(payload).encode()
 
     def json(self):
         return self._payload
 
 
-class DummyRequests:
+class DummySession(requests.Session):
     def __init__(self, responses: List[DummyResponse]):
+        super().__init__()
         self.responses = responses
-        self.calls: List[Dict[str, Any]] = []
+        self.calls: List[requests.PreparedRequest] = []
 
-    def request(self, **kwargs):
-        self.calls.append(kwargs)
+    def send(self, request, **kwargs):
+        self.calls.append(request)
         return self.responses.pop(0)
 
 
@@ -38,9 +42,9 @@ def test_http_get_retries_and_backoff(monkeypatch, caplog):
         DummyResponse(500, {"error": "boom"}),
         DummyResponse(200, {"ok": True}),
     ]
-    fake_requests = DummyRequests(responses)
-    monkeypatch.setattr(http, "requests", fake_requests)
-    monkeypatch.setattr(http.random, "uniform", lambda *_: 1.0)
+    fake_session = DummySession(responses)
+    monkeypatch.setattr(http, "_SESSION", fake_session)
+    monkeypatch.setattr(http, "_rand", lambda: 0.5)
 
     sleeps: List[float] = []
     monkeypatch.setattr(http.time, "sleep", lambda s: sleeps.append(s))
@@ -54,11 +58,72 @@ def test_http_get_retries_and_backoff(monkeypatch, caplog):
 
         assert status == 200
         assert data == {"ok": True}
-        assert len(fake_requests.calls) == 2
-        assert sleeps == [1.5]
+        assert len(fake_session.calls) == 2
+        # The prepared request is built once and re-sent on retry.
+        assert fake_session.calls[0] is fake_session.calls[1]
+        assert sleeps == [0.75]
         assert any(
             "method=GET url=https://example.com/api status=500" in record.message
             for record in caplog.records
         )
     finally:
         logger.remove(handler_id)
+
+
+def test_compute_backoff_delay_full_jitter(monkeypatch):
+    monkeypatch.setattr(http, "_rand", lambda: 1.0)
+    assert http.compute_backoff_delay(0, 1.5, None) == 1.5
+    assert http.compute_backoff_delay(2, 1.5, None) == 6.0
+    # exponential growth is capped before jitter is applied
+    assert http.compute_backoff_delay(10, 1.5, None) == http.ENV.HTTP_BACKOFF_CAP
+
+    monkeypatch.setattr(http, "_rand", lambda: 0.0)
+    assert http.compute_backoff_delay(3, 1.5, None) == 0.1
+
+    assert http.compute_backoff_delay(0, 1.0, "7") == 7.0
+
+
+def test_default_session_is_pooled_and_carries_user_agent():
+    adapter = http._SESSION.get_adapter("https://data.alpaca.markets/v2")
+
+    assert adapter._pool_maxsize == 64
+    assert adapter.max_retries.total == 0
+    assert http._SESSION.headers["User-Agent"] == http.ENV.HTTP_USER_AGENT
+    assert http.shared_session() is http._SESSION
+
+
+def test_alpaca_headers_cached_per_credentials(monkeypatch):
+    monkeypatch.setattr(http.ENV, "ALPACA_API_KEY", "KEY")
+    monkeypatch.setattr(http.ENV, "ALPACA_API_SECRET", "SECRET")
+
+    first = http.alpaca_headers()
+    assert first is http.alpaca_headers()
+    assert first["APCA-API-KEY-ID"] == "KEY"
+
+    merged = http.with_alpaca({"X-Trace": "1"})
+    assert merged["X-Trace"] == "1" and merged["APCA-API-SECRET-KEY"] == "SECRET"
+    assert "X-Trace" not in http.alpaca_headers()
+
+    monkeypatch.setattr(http.ENV, "ALPACA_API_KEY", "")
+    assert "APCA-API-KEY-ID" not in http.alpaca_headers()
+
+
+def test_http_post_json_merges_json_headers(monkeypatch):
+    captured = {}
+
+    def fake_request_json(method, url, **kwargs):
+        captured.update(kwargs, method=method)
+        return 200, {}
+
+    monkeypatch.setattr(http, "request_json", fake_request_json)
+
+    http.http_post_json("https://example.com/orders", {"qty": 1})
+    assert captured["headers"] == {
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+    }
+
+    http.http_post_json("https://example.com/orders", headers={"Accept": "text/csv"})
+    assert captured["headers"]["Accept"] == "text/csv"
+    assert captured["json"] == {}
+    assert http._JSON_HEADERS["Accept"] == "application/json"
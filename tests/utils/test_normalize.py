@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from app.utils.normalize import normalize_quotes_and_dashes, parse_kv_flags
+from app.utils.normalize import (
+    bars_to_map,
+    normalize_quotes_and_dashes,
+    parse_kv_flags,
+    parse_watchlist_args,
+)
 
 
 def test_normalize_quotes_and_dashes_mobile_text():
@@ -9,6 +14,14 @@ def test_normalize_quotes_and_dashes_mobile_text():
     assert normalized == "\"AI\"--said 'Trader' -- let's go!"
 
 
+def test_normalize_quotes_and_dashes_ascii_passthrough():
+    raw = "--limit=10 --title='Plain' AAPL"
+    assert normalize_quotes_and_dashes(raw) is raw
+    assert normalize_quotes_and_dashes("it`s") == "it's"
+    accented = "Café 🚀 AAPL"
+    assert normalize_quotes_and_dashes(accented) is accented
+
+
 def test_parse_kv_flags_with_smart_quotes():
     raw = '--title=“AI Trader” --mode=‘fast’ --limit=15 --note="ready"'
     flags = parse_kv_flags(raw)
@@ -18,3 +31,44 @@ def test_parse_kv_flags_with_smart_quotes():
         "limit": "15",
         "note": "ready",
     }
+
+
+def test_parse_watchlist_args_single_pass():
+    opts = parse_watchlist_args(
+        "--limit=10 --title='Custom List' aapl,msft tsla --no-filters --limit "
+        "--session=pre --bogus=1"
+    )
+    assert opts == {
+        "symbols": ["AAPL", "MSFT", "TSLA"],
+        "limit": 10,
+        "session_hint": "pre",
+        "title": "Custom List",
+        "include_filters": False,
+    }
+    assert parse_watchlist_args("--limit=abc")["limit"] is None
+
+
+def test_parse_watchlist_args_quoting_matches_shlex():
+    opts = parse_watchlist_args('--limit="5" "aapl msft" --title="a b"c')
+    assert opts["symbols"] == ["AAPL", "MSFT"]
+    assert opts["limit"] == 5
+    assert opts["title"] == "a bc"
+    # Unbalanced quotes are kept literally instead of failing the parse.
+    assert parse_watchlist_args("it's aapl")["symbols"] == ["IT'S", "AAPL"]
+    assert parse_watchlist_args('--title="x')["title"] == "x"
+
+
+def test_bars_to_map_handles_list_and_dict_shapes():
+    listed = bars_to_map(
+        [{"S": "aapl", "c": 1}, {"T": "MSFT", "c": 2}, "junk", {"c": 3}],
+        ["AAPL", "TSLA"],
+    )
+    assert listed == {
+        "AAPL": [{"S": "aapl", "c": 1}],
+        "TSLA": [],
+        "MSFT": [{"T": "MSFT", "c": 2}],
+    }
+    assert type(listed) is dict
+
+    keyed = bars_to_map({"aapl": [{"c": 1}, None], "msft": None, "": [{"c": 9}]}, [])
+    assert keyed == {"AAPL": [{"c": 1}], "MSFT": []}